@@ -0,0 +1,54 @@
+"""Optional compiled kernels used to speed up curve generation.
+
+Numba is not a required dependency, and importing it is expensive, so it is
+only imported the first time a curve with at least ``NUMBA_MIN_POINTS``
+points is generated. When it cannot be imported,
+callers fall back to the NumPy code path.
+"""
+from __future__ import annotations
+
+import functools
+import math
+from typing import Callable, Optional
+
+import numpy as np
+
+# Importing Numba and loading the cached kernel costs about half a second,
+# while the kernel saves roughly 40ns per point over NumPy, so it only pays
+# off for curves of around ten million points.
+NUMBA_MIN_POINTS = 10_000_000
+
+_buffer: np.ndarray = np.empty((0, 2), dtype=np.float64)
+
+
+def points_buffer(n: int) -> np.ndarray:
+    """Return an ``(n, 2)`` output buffer, reusing the previous one when sizes match.
+
+    The returned array is overwritten by the next call requesting the same
+    number of points, so callers must consume it before generating again.
+    """
+
+    global _buffer
+    if _buffer.shape[0] != n:
+        _buffer = np.empty((n, 2), dtype=np.float64)
+    return _buffer
+
+
+def _fill(out, theta_step, k, r, d, sign_cos, sign_sin, n):
+    angle_multiplier = k / r
+    for i in range(n):
+        theta = i * theta_step
+        angle = angle_multiplier * theta
+        out[i, 0] = k * math.cos(theta) + sign_cos * d * math.cos(angle)
+        out[i, 1] = k * math.sin(theta) + sign_sin * d * math.sin(angle)
+
+
+@functools.cache
+def compiled_fill() -> Optional[Callable[..., None]]:
+    """Return the Numba-compiled point kernel, or ``None`` when Numba is missing."""
+
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True, fastmath=True)(_fill)
@@ -2,17 +2,18 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import random
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Type
-
-from rich.console import Console
-from rich.prompt import FloatPrompt, IntPrompt, Prompt
-from rich.table import Table
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional, Type
 
 from .config import SpiroConfig, SpiroType
-from .render import build_svg, save_svg
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 
 @dataclass(frozen=True)
@@ -26,79 +27,109 @@ class Knob:
     minimum: Optional[float] = None
     maximum: Optional[float] = None
     choices: Optional[List[str]] = None
+    flag: str = field(init=False, repr=False, compare=False)
+    choice_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "flag", f"--{self.name.replace('_', '-')}")
+        object.__setattr__(self, "choice_set", frozenset(self.choices or ()))
+
+
+_SPIRO_TYPE_VALUES: List[str] = [member.value for member in SpiroType]
+_SPIRO_BY_VALUE: Dict[str, SpiroType] = {member.value: member for member in SpiroType}
+_HEX_RE = re.compile(r"^#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6})$")
+
+
+@functools.cache
+def _knobs() -> Dict[str, Knob]:
+    """Return the knob registry, building it on first use."""
+
+    return {
+        "outer_radius": Knob(
+            name="outer_radius",
+            prompt="Outer radius of the fixed circle",
+            value_type=float,
+            default=180.0,
+            minimum=10.0,
+            maximum=400.0,
+        ),
+        "inner_radius": Knob(
+            name="inner_radius",
+            prompt="Inner radius of the rolling circle",
+            value_type=float,
+            default=75.0,
+            minimum=5.0,
+            maximum=250.0,
+        ),
+        "pen_offset": Knob(
+            name="pen_offset",
+            prompt="Distance of the pen from the rolling circle center",
+            value_type=float,
+            default=40.0,
+            minimum=1.0,
+            maximum=250.0,
+        ),
+        "theta_step": Knob(
+            name="theta_step",
+            prompt="Angle step between points (smaller = smoother)",
+            value_type=float,
+            default=0.02,
+            minimum=0.001,
+            maximum=0.2,
+        ),
+        "cycles": Knob(
+            name="cycles",
+            prompt="Number of rotations to complete",
+            value_type=float,
+            default=20.0,
+            minimum=1.0,
+            maximum=60.0,
+        ),
+        "stroke_width": Knob(
+            name="stroke_width",
+            prompt="Stroke width of the curve",
+            value_type=float,
+            default=2.0,
+            minimum=0.1,
+            maximum=10.0,
+        ),
+        "canvas_size": Knob(
+            name="canvas_size",
+            prompt="Canvas size in pixels",
+            value_type=int,
+            default=900,
+            minimum=200,
+            maximum=3000,
+        ),
+        "stroke_color": Knob(
+            name="stroke_color",
+            prompt="Stroke color (hex)",
+            value_type=str,
+            default="#1f77b4",
+        ),
+        "spiro_type": Knob(
+            name="spiro_type",
+            prompt="Spirograph type",
+            value_type=str,
+            default=SpiroType.HYPOTROCHOID.value,
+            choices=_SPIRO_TYPE_VALUES,
+        ),
+    }
+
+
+def _add_float(parser: argparse.ArgumentParser, knob: Knob) -> None:
+    parser.add_argument(knob.flag, type=float, help=knob.prompt)
+
+
+def _add_int(parser: argparse.ArgumentParser, knob: Knob) -> None:
+    parser.add_argument(knob.flag, type=int, help=knob.prompt)
+
 
+def _add_str(parser: argparse.ArgumentParser, knob: Knob) -> None:
+    parser.add_argument(knob.flag, choices=knob.choices, help=knob.prompt)
 
-KNOBS: Dict[str, Knob] = {
-    "outer_radius": Knob(
-        name="outer_radius",
-        prompt="Outer radius of the fixed circle",
-        value_type=float,
-        default=180.0,
-        minimum=10.0,
-        maximum=400.0,
-    ),
-    "inner_radius": Knob(
-        name="inner_radius",
-        prompt="Inner radius of the rolling circle",
-        value_type=float,
-        default=75.0,
-        minimum=5.0,
-        maximum=250.0,
-    ),
-    "pen_offset": Knob(
-        name="pen_offset",
-        prompt="Distance of the pen from the rolling circle center",
-        value_type=float,
-        default=40.0,
-        minimum=1.0,
-        maximum=250.0,
-    ),
-    "theta_step": Knob(
-        name="theta_step",
-        prompt="Angle step between points (smaller = smoother)",
-        value_type=float,
-        default=0.02,
-        minimum=0.001,
-        maximum=0.2,
-    ),
-    "cycles": Knob(
-        name="cycles",
-        prompt="Number of rotations to complete",
-        value_type=float,
-        default=20.0,
-        minimum=1.0,
-        maximum=60.0,
-    ),
-    "stroke_width": Knob(
-        name="stroke_width",
-        prompt="Stroke width of the curve",
-        value_type=float,
-        default=2.0,
-        minimum=0.1,
-        maximum=10.0,
-    ),
-    "canvas_size": Knob(
-        name="canvas_size",
-        prompt="Canvas size in pixels",
-        value_type=int,
-        default=900,
-        minimum=200,
-        maximum=3000,
-    ),
-    "stroke_color": Knob(
-        name="stroke_color",
-        prompt="Stroke color (hex)",
-        value_type=str,
-        default="#1f77b4",
-    ),
-    "spiro_type": Knob(
-        name="spiro_type",
-        prompt="Spirograph type",
-        value_type=str,
-        default=SpiroType.HYPOTROCHOID.value,
-        choices=[member.value for member in SpiroType],
-    ),
-}
+
+_ADDER = {float: _add_float, int: _add_int, str: _add_str}
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -106,34 +137,21 @@ def parse_arguments() -> argparse.Namespace:
     parser.add_argument("--output", type=Path, help="Path to save the generated SVG")
     parser.add_argument("--design-number", type=int, help="Design number used as the random seed")
     parser.add_argument("--random", action="store_true", help="Generate all knobs randomly")
-    for knob in KNOBS.values():
-        if knob.name == "spiro_type":
-            parser.add_argument(
-                f"--{knob.name.replace('_', '-')}",
-                choices=knob.choices,
-                help=knob.prompt,
-            )
-        elif knob.value_type is int:
-            parser.add_argument(
-                f"--{knob.name.replace('_', '-')}",
-                type=int,
-                help=knob.prompt,
-            )
-        elif knob.value_type is float:
-            parser.add_argument(
-                f"--{knob.name.replace('_', '-')}",
-                type=float,
-                help=knob.prompt,
-            )
-        else:
-            parser.add_argument(
-                f"--{knob.name.replace('_', '-')}",
-                help=knob.prompt,
-            )
-    return parser.parse_args()
-
-
-def _prompt_for_knob(console: Console, knob: Knob) -> object:
+    parser.add_argument("--quiet", action="store_true", help="Skip status messages and the summary table")
+    parser.add_argument("--count", type=int, default=1, help="Number of random designs to generate in one run")
+    for knob in _knobs().values():
+        _ADDER[knob.value_type](parser, knob)
+    args = parser.parse_args()
+    if args.count < 1:
+        parser.error("--count must be >= 1")
+    if args.count > 1 and not args.random:
+        parser.error("--count requires --random")
+    return args
+
+
+def _prompt_for_knob(console: Optional[Console], knob: Knob) -> object:
+    from rich.prompt import FloatPrompt, IntPrompt, Prompt
+
     if knob.value_type is float:
         return FloatPrompt.ask(knob.prompt, default=str(knob.default))
     if knob.value_type is int:
@@ -160,12 +178,12 @@ def _normalize_value(name: str, value: object, knob: Knob) -> object:
         value = int(value)
         return _validate_range(name, value, knob)
     if knob.choices:
-        if value not in knob.choices:
+        if value not in knob.choice_set:
             raise ValueError(f"Invalid choice {value} for {name}")
         return value
     if name == "stroke_color":
         text = str(value).strip()
-        if not text.startswith("#") or len(text) not in {4, 7}:
+        if not _HEX_RE.match(text):
             raise ValueError("Stroke color must be a hex value like #ff00aa")
         return text.lower()
     return value
@@ -185,15 +203,19 @@ def _random_value(knob: Knob, rng: random.Random) -> object:
     return knob.default
 
 
-def _collect_knob_values(args: argparse.Namespace, console: Console, rng: random.Random) -> Dict[str, object]:
+def _collect_knob_values(
+    args: argparse.Namespace, console: Optional[Console], rng: random.Random
+) -> Dict[str, object]:
     values: Dict[str, object] = {}
     if args.random:
-        console.print("[bold green]Random mode enabled[/bold green]")
-        for name, knob in KNOBS.items():
-            raw_value = _random_value(knob, rng)
-            values[name] = _normalize_value(name, raw_value, knob)
+        if console is not None:
+            console.print("[bold green]Random mode enabled[/bold green]")
+        # Random values are drawn inside each knob's range with its native
+        # type, so they skip the normalization applied to user input.
+        for name, knob in _knobs().items():
+            values[name] = _random_value(knob, rng)
     else:
-        for name, knob in KNOBS.items():
+        for name, knob in _knobs().items():
             cli_value = getattr(args, name)
             if cli_value is not None:
                 raw_value = cli_value
@@ -213,11 +235,17 @@ def _build_config(values: Dict[str, object]) -> SpiroConfig:
         stroke_width=float(values["stroke_width"]),
         stroke_color=str(values["stroke_color"]),
         canvas_size=int(values["canvas_size"]),
-        spiro_type=SpiroType(str(values["spiro_type"]))
+        spiro_type=_SPIRO_BY_VALUE[str(values["spiro_type"])],
     )
 
 
 def _summarize_config(console: Console, config: SpiroConfig, design_number: int, output_path: Path) -> None:
+    if not console.is_terminal:
+        print(f"Saved {output_path}")
+        return
+
+    from rich.table import Table
+
     table = Table(title="Spirograph Design Summary")
     table.add_column("Knob")
     table.add_column("Value", justify="right")
@@ -235,27 +263,47 @@ def _summarize_config(console: Console, config: SpiroConfig, design_number: int,
     console.print(table)
 
 
-def _prepare_rng(console: Console, args: argparse.Namespace) -> tuple[random.Random, int]:
+def _prepare_rng(
+    console: Optional[Console], args: argparse.Namespace, offset: int = 0
+) -> tuple[random.Random, int]:
     if args.design_number is not None:
-        design_number = args.design_number
+        design_number = args.design_number + offset
     elif args.random:
         design_number = random.SystemRandom().randint(1, 2**31 - 1)
-        console.print(f"Generated design number [bold]{design_number}[/bold] for this random run")
+        if console is not None:
+            console.print(f"Generated design number [bold]{design_number}[/bold] for this random run")
     else:
+        from rich.prompt import IntPrompt
+
         design_number = IntPrompt.ask("Design number (seed)", default=1)
     rng = random.Random(design_number)
     return rng, design_number
 
 
+def _batch_output_path(output: Path, design_number: int) -> Path:
+    return output.with_name(f"{output.stem}-{design_number}{output.suffix}")
+
+
 def main() -> None:
     args = parse_arguments()
-    console = Console()
-    rng, design_number = _prepare_rng(console, args)
-    values = _collect_knob_values(args, console, rng)
-    config = _build_config(values)
-    svg = build_svg(config, design_number)
-    output_path = save_svg(svg, args.output)
-    _summarize_config(console, config, design_number, output_path)
+    from .render import default_output_path, write_svg
+
+    console: Optional[Console] = None
+    if not args.quiet:
+        from rich.console import Console
+
+        console = Console()
+    now = datetime.utcnow()
+    for index in range(args.count):
+        rng, design_number = _prepare_rng(console, args, offset=index)
+        values = _collect_knob_values(args, console, rng)
+        config = _build_config(values)
+        output = args.output
+        if args.count > 1:
+            output = _batch_output_path(output or default_output_path(now), design_number)
+        output_path = write_svg(config, design_number, output, timestamp=now)
+        if console is not None:
+            _summarize_config(console, config, design_number, output_path)
 
 
 if __name__ == "__main__":
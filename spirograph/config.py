@@ -3,7 +3,6 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Tuple
 
 
 class SpiroType(str, Enum):
@@ -26,11 +25,3 @@ class SpiroConfig:
     stroke_color: str
     canvas_size: int
     spiro_type: SpiroType
-
-    def extent(self) -> Tuple[float, float]:
-        """Return a tuple containing the min and max radius for scaling."""
-
-        if self.spiro_type is SpiroType.HYPOTROCHOID:
-            return (self.outer_radius - self.inner_radius - self.pen_offset,
-                    self.outer_radius + self.pen_offset)
-        return (0, self.outer_radius + self.inner_radius + self.pen_offset)
@@ -1,89 +1,102 @@
 """Spirograph curve generation utilities."""
 from __future__ import annotations
 
-import math
-from typing import List, Sequence, Tuple
+from math import pi
+from typing import Iterator, List, Tuple
 
+import numpy as np
+
+from . import _kernels
 from .config import SpiroConfig, SpiroType
 
 Point = Tuple[float, float]
 
+PATH_CHUNK_POINTS = 4096
+# Coordinates are in pixels, so a tenth of a pixel is below what renderers can show.
+COORDINATE_PRECISION = 1
+
+
+def _step_count(config: SpiroConfig) -> int:
+    total_angle = 2 * pi * config.cycles
+    return max(1, int(total_angle / config.theta_step))
 
-def _hypotrochoid_point(theta: float, config: SpiroConfig) -> Point:
-    r, R, d = config.inner_radius, config.outer_radius, config.pen_offset
-    k = R - r
-    cos_theta = math.cos(theta)
-    sin_theta = math.sin(theta)
-    angle_multiplier = k / r
-    return (
-        k * cos_theta + d * math.cos(angle_multiplier * theta),
-        k * sin_theta - d * math.sin(angle_multiplier * theta),
-    )
 
+def _points_array(config: SpiroConfig) -> np.ndarray:
+    """Evaluate the configured curve as an ``(N, 2)`` array of raw points.
+
+    Large curves use the Numba kernel when it is available; its output buffer
+    is reused between calls, so the result must be consumed before the next
+    call.
+    """
 
-def _epitrochoid_point(theta: float, config: SpiroConfig) -> Point:
     r, R, d = config.inner_radius, config.outer_radius, config.pen_offset
-    k = R + r
-    cos_theta = math.cos(theta)
-    sin_theta = math.sin(theta)
+    if config.spiro_type is SpiroType.HYPOTROCHOID:
+        k = R - r
+        sign = 1.0
+    else:
+        k = R + r
+        sign = -1.0
     angle_multiplier = k / r
-    return (
-        k * cos_theta - d * math.cos(angle_multiplier * theta),
-        k * sin_theta - d * math.sin(angle_multiplier * theta),
-    )
 
+    count = _step_count(config) + 1
+    fill = _kernels.compiled_fill() if count >= _kernels.NUMBA_MIN_POINTS else None
+    if fill is not None:
+        points = _kernels.points_buffer(count)
+        fill(points, config.theta_step, k, r, d, sign, -1.0, count)
+        return points
 
-def generate_points(config: SpiroConfig) -> List[Point]:
-    """Generate all points for the configured Spirograph curve."""
+    theta = np.arange(count, dtype=np.float64) * config.theta_step
+    angle = angle_multiplier * theta
+    x = k * np.cos(theta) + sign * d * np.cos(angle)
+    y = k * np.sin(theta) - d * np.sin(angle)
+    return np.column_stack((x, y))
 
-    total_angle = 2 * math.pi * config.cycles
-    steps = max(1, int(total_angle / config.theta_step))
-    points: List[Point] = []
-    for index in range(steps + 1):
-        theta = index * config.theta_step
-        if config.spiro_type is SpiroType.HYPOTROCHOID:
-            point = _hypotrochoid_point(theta, config)
-        else:
-            point = _epitrochoid_point(theta, config)
-        points.append(point)
-    return points
 
+def generate_points(config: SpiroConfig) -> List[Point]:
+    """Generate all points for the configured Spirograph curve."""
 
-def scale_points(points: Sequence[Point], config: SpiroConfig) -> List[Point]:
-    """Scale raw curve points to fit inside the configured canvas."""
+    return [tuple(point) for point in _points_array(config).tolist()]
 
-    if not points:
-        return []
 
-    min_extent, max_extent = config.extent()
-    span = max_extent - min_extent
-    if math.isclose(span, 0.0):
-        span = max(config.outer_radius, 1.0)
-    half_canvas = config.canvas_size / 2
-    scale = half_canvas / max(span / 2, 1.0)
+def iter_path_chunks(
+    config: SpiroConfig, use_path: bool = False, chunk_size: int = PATH_CHUNK_POINTS
+) -> Iterator[str]:
+    """Yield the scaled curve coordinates in chunks of ``chunk_size`` points.
 
-    scaled: List[Point] = []
-    for x, y in points:
-        scaled.append((half_canvas + x * scale, half_canvas + y * scale))
-    return scaled
+    Concatenating the chunks gives the same text as :func:`build_path`, which
+    lets callers stream large curves straight to a file.
+    """
 
+    points = _points_array(config)
 
-def points_to_path(points: Sequence[Point]) -> str:
-    """Convert a sequence of points into an SVG path string."""
+    low = points.min(axis=0)
+    high = points.max(axis=0)
+    span = float((high - low).max())
+    # Leave half a stroke of margin on every side so the line is never clipped.
+    drawable = max(config.canvas_size - config.stroke_width, 1.0)
+    scale = drawable / span if span > 0.0 else 1.0
+    points -= (low + high) / 2
+    points *= scale
+    points += config.canvas_size / 2
 
-    if not points:
-        raise ValueError("Cannot build a path from an empty sequence of points")
+    number = f"%.{COORDINATE_PRECISION}f"
+    if use_path:
+        first, point = f"M {number} {number}", f" L {number} {number}"
+    else:
+        first, point = f"{number},{number}", f" {number},{number}"
+    yield first % tuple(points[0].tolist())
+    full_template = point * chunk_size
+    for start in range(1, len(points), chunk_size):
+        chunk = points[start:start + chunk_size]
+        template = full_template if len(chunk) == chunk_size else point * len(chunk)
+        yield template % tuple(chunk.ravel().tolist())
 
-    iterator = iter(points)
-    first = next(iterator)
-    segments = [f"M {first[0]:.3f} {first[1]:.3f}"]
-    segments.extend(f"L {x:.3f} {y:.3f}" for x, y in iterator)
-    return " ".join(segments)
 
+def build_path(config: SpiroConfig, use_path: bool = False) -> str:
+    """Generate the scaled curve coordinates for the provided configuration.
 
-def generate_path(config: SpiroConfig) -> str:
-    """Generate a scaled SVG path for the provided configuration."""
+    By default the result is a ``<polyline>`` points list (``"x,y x,y ..."``).
+    Pass ``use_path=True`` to get ``<path>`` data (``"M x y L x y ..."``) instead.
+    """
 
-    points = generate_points(config)
-    scaled_points = scale_points(points, config)
-    return points_to_path(scaled_points)
+    return "".join(iter_path_chunks(config, use_path=use_path))
@@ -6,38 +6,91 @@ from pathlib import Path
 from typing import Optional
 
 from .config import SpiroConfig
-from .generator import generate_path
-
-SVG_TEMPLATE = """<?xml version=\"1.0\" encoding=\"UTF-8\"?>
-<svg xmlns=\"http://www.w3.org/2000/svg\" width=\"{size}\" height=\"{size}\" viewBox=\"0 0 {size} {size}\">
-  <title>Spirograph Design {design_number}</title>
-  <desc>Generated on {timestamp}</desc>
-  <rect x=\"0\" y=\"0\" width=\"{size}\" height=\"{size}\" fill=\"white\" />
-  <path d=\"{path}\" fill=\"none\" stroke=\"{stroke_color}\" stroke-width=\"{stroke_width}\" stroke-linecap=\"round\" stroke-linejoin=\"round\" />
+from .generator import build_path, iter_path_chunks
+
+SVG_HEADER = """<?xml version=\"1.0\" encoding=\"UTF-8\"?>
+<svg xmlns=\"http://www.w3.org/2000/svg\" width=\"%(size)d\" height=\"%(size)d\" viewBox=\"0 0 %(size)d %(size)d\">
+  <title>Spirograph Design %(design_number)d</title>
+  <desc>Generated on %(timestamp)s</desc>
+  <rect x=\"0\" y=\"0\" width=\"%(size)d\" height=\"%(size)d\" fill=\"white\" />
+"""
+
+PATH_OPEN = '  <path d="'
+POLYLINE_OPEN = '  <polyline points="'
+
+SVG_FOOTER = """\" fill=\"none\" stroke=\"%(stroke_color)s\" stroke-width=\"%(stroke_width)s\" stroke-linecap=\"round\" stroke-linejoin=\"round\" />
 </svg>
 """
 
+WRITE_BUFFER_SIZE = 1 << 16
+
+
+def _svg_header(config: SpiroConfig, design_number: int, timestamp: datetime, use_path: bool) -> str:
+    header = SVG_HEADER % {
+        "size": config.canvas_size,
+        "design_number": design_number,
+        "timestamp": timestamp.isoformat(timespec="seconds"),
+    }
+    return header + (PATH_OPEN if use_path else POLYLINE_OPEN)
+
 
-def build_svg(config: SpiroConfig, design_number: int) -> str:
-    """Build the SVG document for the provided configuration."""
+def _svg_footer(config: SpiroConfig) -> str:
+    return SVG_FOOTER % {
+        "stroke_color": config.stroke_color,
+        "stroke_width": config.stroke_width,
+    }
 
-    path = generate_path(config)
-    return SVG_TEMPLATE.format(
-        size=config.canvas_size,
-        path=path,
-        stroke_color=config.stroke_color,
-        stroke_width=config.stroke_width,
-        timestamp=datetime.utcnow().isoformat(timespec="seconds"),
-        design_number=design_number,
+
+def build_svg(
+    config: SpiroConfig,
+    design_number: int,
+    timestamp: Optional[datetime] = None,
+    use_path: bool = False,
+) -> str:
+    """Build the SVG document for the provided configuration.
+
+    The curve is emitted as a ``<polyline>`` unless ``use_path`` is set, in
+    which case the equivalent ``<path>`` element is written. ``timestamp``
+    defaults to the current UTC time.
+    """
+
+    if timestamp is None:
+        timestamp = datetime.utcnow()
+    return (
+        _svg_header(config, design_number, timestamp, use_path)
+        + build_path(config, use_path=use_path)
+        + _svg_footer(config)
     )
 
 
-def save_svg(svg_content: str, output: Optional[Path]) -> Path:
-    """Persist the SVG document to disk, returning the output path."""
+def default_output_path(timestamp: datetime) -> Path:
+    """Return a file name in the current directory stamped with ``timestamp``."""
+
+    return Path(f"spirograph-{timestamp.strftime('%Y%m%d-%H%M%S')}.svg")
+
+
+def write_svg(
+    config: SpiroConfig,
+    design_number: int,
+    output: Optional[Path],
+    timestamp: Optional[datetime] = None,
+    use_path: bool = False,
+) -> Path:
+    """Stream the SVG document to disk, returning the output path.
+
+    The curve is written in chunks rather than built as one string first,
+    which keeps peak memory low for large designs. The same ``timestamp``
+    (default: the current UTC time) is used for the document metadata and
+    the default file name.
+    """
 
+    if timestamp is None:
+        timestamp = datetime.utcnow()
     if output is None:
-        timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
-        output = Path(f"spirograph-{timestamp}.svg")
+        output = default_output_path(timestamp)
     output_path = output if isinstance(output, Path) else Path(output)
-    output_path.write_text(svg_content, encoding="utf-8")
+    with open(output_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as handle:
+        handle.write(_svg_header(config, design_number, timestamp, use_path))
+        handle.writelines(iter_path_chunks(config, use_path=use_path))
+        handle.write(_svg_footer(config))
     return output_path